@@ -1,9 +1,9 @@
 import os
+import re
 import sys
 
 import click
 
-from .dependency_manager import DependencyManager
 from .exceptions import (
     ConfigurationError,
     DependencyConflictError,
@@ -11,7 +11,10 @@ from .exceptions import (
     PackageNotFoundError,
 )
 from .logger import setup_logger
-from .packager import LambdaPackager
+
+# Leading project name of a requirement spec, e.g. "requests" out of
+# "requests[socks]>=2.28"
+_NAME_RE = re.compile(r"^\s*([A-Za-z0-9_.\-]+)")
 
 
 def handle_cli_error(func):
@@ -136,6 +139,9 @@ def create_layer(
     include_dependencies,
 ):
     """Create a Lambda layer from requirements or package list."""
+    # Imported lazily so --help and argument errors stay cheap
+    from .packager import LambdaPackager
+
     # Validate input
     if not requirements and not packages:
         click.echo("Error: Must specify either --requirements or --packages", err=True)
@@ -158,18 +164,18 @@ def create_layer(
         "include_dependencies": include_dependencies,
     }
 
-    # Initialize packager with config
-    packager = LambdaPackager(runtime, output_dir, config)
-
-    if requirements:
-        click.echo(f"Creating layer from requirements file: {requirements}")
-        path = packager.create_layer_from_requirements(requirements, name)
-        click.echo(f"✓ Created layer at: {path}")
-    else:
-        package_list = parse_list(packages)
-        click.echo(f"Creating layer from packages: {', '.join(package_list)}")
-        path = packager.create_layer_from_packages(package_list, name)
-        click.echo(f"✓ Created layer at: {path}")
+    # Initialize packager with config; the context manager cleans up the
+    # build's temporary directory at a well-defined point
+    with LambdaPackager(runtime, output_dir, config) as packager:
+        if requirements:
+            click.echo(f"Creating layer from requirements file: {requirements}")
+            path = packager.create_layer_from_requirements(requirements, name)
+            click.echo(f"✓ Created layer at: {path}")
+        else:
+            package_list = parse_list(packages)
+            click.echo(f"Creating layer from packages: {', '.join(package_list)}")
+            path = packager.create_layer_from_packages(package_list, name)
+            click.echo(f"✓ Created layer at: {path}")
 
 
 @cli.command(name="analyze")
@@ -183,6 +189,9 @@ def create_layer(
 @handle_cli_error
 def analyze(requirements, exclude_packages, include_dependencies):
     """Analyze dependencies in requirements.txt file."""
+    # Imported lazily so --help and argument errors stay cheap
+    from .packager import LambdaPackager
+
     if not os.path.exists(requirements):
         raise FileNotFoundError(2, "No such file", requirements)
 
@@ -193,8 +202,6 @@ def analyze(requirements, exclude_packages, include_dependencies):
         "include_dependencies": include_dependencies,
     }
 
-    packager = LambdaPackager("python3.9", "./dist", config)
-
     try:
         # Read requirements file
         with open(requirements) as f:
@@ -202,7 +209,8 @@ def analyze(requirements, exclude_packages, include_dependencies):
                 line.strip() for line in f if line.strip() and not line.startswith("#")
             ]
 
-        deps = packager.dependency_manager.resolve_dependencies(packages)
+        with LambdaPackager("python3.9", "./dist", config) as packager:
+            deps = packager.dependency_manager.resolve_dependencies(packages)
 
         # Filter excluded packages
         deps = {
@@ -215,15 +223,15 @@ def analyze(requirements, exclude_packages, include_dependencies):
         click.echo("\nPackage Dependencies:")
         click.echo("=" * 50)
 
-        # Group by top-level and sub-dependencies
+        # Group by top-level and sub-dependencies; precompute the set of
+        # requested names once instead of rebuilding it per resolved dep
+        top_level_names = frozenset(
+            m.group(1).lower() for p in packages if (m := _NAME_RE.match(p))
+        )
         top_level = {
             name: version
             for name, version in deps.items()
-            if name.lower()
-            in [
-                p.split("[")[0].split("==")[0].split(">=")[0].split("<")[0].lower()
-                for p in packages
-            ]
+            if name.lower() in top_level_names
         }
 
         # Show top-level dependencies
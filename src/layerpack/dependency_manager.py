@@ -1,60 +1,72 @@
+import functools
+import hashlib
+import json
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
+import time
+from pathlib import Path
+from typing import Optional
 
 from .exceptions import DependencyConflictError, PackageNotFoundError
 from .logger import logger
 
+# How long a cached resolution stays valid, and how many entries to keep
+RESOLVE_CACHE_TTL = 24 * 60 * 60
+RESOLVE_CACHE_MAX_ENTRIES = 64
 
-class DependencyManager:
-    def __init__(self, uv_path=None):
-        """Initialize temporary directory for package management.
 
-        Args:
-            uv_path: Optional path to uv executable.
-            If not provided, will attempt to find it.
-        """
-        self.temp_dir = tempfile.mkdtemp()
-        logger.debug(f"Initialized temporary directory at {self.temp_dir}")
-        self.uv_path = uv_path
-        self.use_uv = self._check_uv_available()
+@functools.lru_cache(maxsize=8)
+def _probe_uv(uv_path: Optional[str], path_env: str) -> Optional[tuple[str, str]]:
+    """Locate a working uv executable.
 
-    def _check_uv_available(self) -> bool:
-        """Check if uv is available in the environment."""
-        try:
-            # If uv_path is provided, use that directly
-            if self.uv_path:
-                subprocess.run(
-                    [self.uv_path, "--version"],
-                    check=True,
-                    capture_output=True,
-                    text=True,
-                )
-                return True
+    Memoized at module level so repeated DependencyManager construction
+    does not re-spawn a probe subprocess per instance.
 
-            # Otherwise try to find uv in PATH
+    Args:
+        uv_path: Optional explicit path to uv
+        path_env: The PATH environment value to search
+
+    Returns:
+        Tuple of (path, reported version) for a working uv executable,
+        or None if unavailable
+    """
+    candidate = uv_path or shutil.which("uv", path=path_env)
+    if candidate:
+        try:
             result = subprocess.run(
-                ["which", "uv"],
+                [candidate, "--version"],
                 check=True,
                 capture_output=True,
                 text=True,
             )
-            self.uv_path = result.stdout.strip()
+            return candidate, result.stdout.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            pass
+    logger.debug("uv not available, falling back to pip")
+    return None
 
-            # Verify the found uv works
-            subprocess.run(
-                [self.uv_path, "--version"],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            return True
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.debug("uv not available, falling back to pip")
-            self.uv_path = None
-            return False
+class DependencyManager:
+    def __init__(self, uv_path=None):
+        """Initialize temporary directory for package management.
+
+        Args:
+            uv_path: Optional path to uv executable.
+            If not provided, will attempt to find it.
+        """
+        self.temp_dir = tempfile.mkdtemp()
+        logger.debug(f"Initialized temporary directory at {self.temp_dir}")
+        self.cache_dir = Path(
+            os.environ.get("LAYERPACK_CACHE", Path.home() / ".cache" / "layerpack")
+        )
+        probe = _probe_uv(uv_path, os.environ.get("PATH", ""))
+        self.uv_path, self.uv_version = probe if probe else (None, None)
+        self.use_uv = self.uv_path is not None
+        # In-process fastpath in front of the on-disk resolve cache
+        self._resolve_memo: dict[frozenset, dict[str, str]] = {}
 
     def resolve_dependencies(self, packages: list[str]) -> dict[str, str]:
         """
@@ -82,17 +94,47 @@ class DependencyManager:
 
             logger.debug(f"Adding dependencies: {package_specs}")
 
+            # Repeat resolutions within this process return straight
+            # from memory
+            memo_key = frozenset(package_specs)
+            if memo_key in self._resolve_memo:
+                return self._resolve_memo[memo_key]
+
+            # Check the on-disk cache before spawning a resolver subprocess
+            cache_file = self._resolve_cache_file(package_specs)
+            if (
+                cache_file.exists()
+                and time.time() - cache_file.stat().st_mtime < RESOLVE_CACHE_TTL
+            ):
+                logger.debug(f"Using cached resolution from {cache_file}")
+                dependencies = json.loads(cache_file.read_text())
+                self._resolve_memo[memo_key] = dependencies
+                return dependencies
+
             # Create requirements.txt
             req_file = os.path.join(self.temp_dir, "requirements.txt")
             with open(req_file, "w") as f:
                 for package in package_specs:
                     f.write(f"{package}\n")
 
+            report_file = os.path.join(self.temp_dir, "report.json")
             if self.use_uv:
                 cmd = [self.uv_path, "pip", "compile", req_file]
             else:
-                # Fallback to pip
-                cmd = ["pip", "freeze"]
+                # Fallback to pip: a dry-run install resolves the input
+                # requirements and emits a JSON report without downloading
+                # wheels (only PEP 658 metadata files are fetched)
+                cmd = [
+                    "pip",
+                    "install",
+                    "--dry-run",
+                    "--ignore-installed",
+                    "--quiet",
+                    "--report",
+                    report_file,
+                    "-r",
+                    req_file,
+                ]
 
             try:
                 result = subprocess.run(
@@ -116,29 +158,72 @@ class DependencyManager:
 
             # Parse the resolved dependencies
             dependencies = {}
-            for line in result.stdout.splitlines():
-                if line and not line.startswith("#"):
-                    try:
-                        name, version = line.split("==")
-                        dependencies[name.strip()] = version.strip()
-                    except ValueError:
-                        continue
+            if self.use_uv:
+                for line in result.stdout.splitlines():
+                    if line and not line.startswith("#"):
+                        try:
+                            name, version = line.split("==")
+                            dependencies[name.strip()] = version.strip()
+                        except ValueError:
+                            continue
+            else:
+                with open(report_file) as f:
+                    report = json.load(f)
+                for item in report.get("install", []):
+                    metadata = item["metadata"]
+                    dependencies[metadata["name"]] = metadata["version"]
 
             logger.info(f"Successfully resolved {len(dependencies)} dependencies")
             for name, version in dependencies.items():
                 logger.debug(f"Resolved: {name}=={version}")
+
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(dependencies))
+            self._evict_stale_resolutions(cache_file.parent)
+            self._resolve_memo[memo_key] = dependencies
             return dependencies
 
         except Exception as e:
             logger.error(f"Dependency resolution failed: {str(e)}")
             raise
 
-    def download_packages(self, package_specs: dict[str, str]) -> str:
+    def _resolve_cache_file(self, package_specs: list[str]) -> Path:
+        """Return the cache file for a set of specs in this environment.
+
+        The key folds in the interpreter version, platform, and resolver
+        version: resolutions depend on environment markers and resolver
+        behavior, so environments sharing a cache directory must never
+        serve each other's pins.
+        """
+        resolver = f"uv {self.uv_version}" if self.use_uv else "pip"
+        fingerprint = "\n".join(
+            sorted(package_specs)
+            + [
+                f"python={sys.version_info[0]}.{sys.version_info[1]}",
+                f"platform={sys.platform}",
+                f"resolver={resolver}",
+            ]
+        )
+        key = hashlib.sha256(fingerprint.encode()).hexdigest()
+        return self.cache_dir / "resolve" / f"{key}.json"
+
+    @staticmethod
+    def _evict_stale_resolutions(cache_dir: Path):
+        """Drop the oldest cached resolutions beyond the entry limit."""
+        entries = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-RESOLVE_CACHE_MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+
+    def download_packages(
+        self, package_specs: dict[str, str], target_dir: Optional[str] = None
+    ) -> str:
         """
         Download packages to a local directory.
 
         Args:
             package_specs: Dictionary of package names and versions
+            target_dir: Optional directory to install into. Defaults to
+                a "packages" directory under the temporary directory.
 
         Returns:
             Path to the directory containing downloaded packages
@@ -146,30 +231,45 @@ class DependencyManager:
         logger.info(f"Downloading {len(package_specs)} packages...")
         logger.debug(f"Package specs: {package_specs}")
 
-        download_dir = os.path.join(self.temp_dir, "packages")
+        download_dir = target_dir or os.path.join(self.temp_dir, "packages")
         os.makedirs(download_dir, exist_ok=True)
 
-        try:
-            # Download each package individually to track progress
+        # Write all pinned specs to a single lock file so the installer
+        # runs once instead of once per package
+        lock_path = os.path.join(self.temp_dir, "resolved.txt")
+        with open(lock_path, "w") as f:
             for name, version in package_specs.items():
-                logger.info(f"Installing {name}=={version}")
+                f.write(f"{name}=={version}\n")
 
-                install_cmd = [
-                    self.uv_path if self.use_uv else "pip",
-                    "pip" if self.use_uv else "",
-                    "install",
-                    f"{name}=={version}",
-                    "--target",
-                    download_dir,
-                ]
-                # Remove empty strings from the command
-                install_cmd = [cmd for cmd in install_cmd if cmd]
+        if self.use_uv:
+            install_cmd = [self.uv_path, "pip", "install"]
+        else:
+            install_cmd = ["pip", "install"]
+        # Resolution already happened in resolve_dependencies, so --no-deps
+        install_cmd += ["--no-deps", "-r", lock_path, "--target", download_dir]
 
-                subprocess.run(
-                    install_cmd,
-                    check=True,
-                    capture_output=True,
-                    text=True,
+        # Point the installer at a persistent wheel cache so repeat runs
+        # skip the network; cleanup() only ever wipes the temp dir
+        install_env = {
+            **os.environ,
+            "UV_CACHE_DIR": str(self.cache_dir / "uv"),
+            "PIP_CACHE_DIR": str(self.cache_dir / "pip"),
+        }
+
+        try:
+            # Discard the installer's stdout instead of buffering the whole
+            # stream in memory; only stderr is kept for error reporting
+            proc = subprocess.Popen(
+                install_cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=install_env,
+            )
+            _, stderr = proc.communicate()
+            if proc.returncode:
+                raise subprocess.CalledProcessError(
+                    proc.returncode, install_cmd, stderr=stderr
                 )
 
             logger.info(f"Successfully downloaded packages to {download_dir}")
@@ -189,6 +289,9 @@ class DependencyManager:
         except Exception as e:
             logger.warning(f"Failed to cleanup temporary directory: {e}")
 
-    def __del__(self):
-        """Ensure cleanup on object destruction."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        """Cleanup at a well-defined point instead of GC time."""
         self.cleanup()
@@ -28,5 +28,6 @@ def setup_logger(verbose: bool = False) -> logging.Logger:
     return logger
 
 
-# Global logger instance
-logger = setup_logger()
+# Global logger instance; handlers are attached by setup_logger(), which
+# the CLI calls on startup, so importing this module configures nothing
+logger = logging.getLogger("layerpack")
@@ -0,0 +1,133 @@
+import copy
+import os
+from collections import namedtuple
+from types import SimpleNamespace
+
+import pytest
+
+_Paths = namedtuple("_Paths", ["base", "packages", "layer", "zip"])
+
+
+def _stub(**kw):
+    """Build a SimpleNamespace whose attributes return canned values.
+
+    The packager tests never assert on call args, so full Mock machinery
+    is wasted on them; a namespace of plain callables is far cheaper to
+    construct and to call. Callable values are kept as-is, everything
+    else is wrapped in a lambda returning it.
+    """
+    return SimpleNamespace(
+        **{k: v if callable(v) else (lambda *a, _v=v, **kw2: _v) for k, v in kw.items()}
+    )
+
+
+@pytest.fixture(scope="session")
+def _dm_proto():
+    """Prototype DependencyManager instance stub.
+
+    Session scope is per-process, so under pytest-xdist each worker
+    builds its own prototype exactly once and the construction cost is
+    amortized across that worker's share of the tests.
+    """
+    return _stub(
+        resolve_dependencies={"requests": "2.28.1"},
+        download_packages=None,
+        cleanup=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def _builder_proto():
+    """Prototype LayerBuilder instance stub, built once per run."""
+    return _stub(create_layer_structure="", create_zip="")
+
+
+@pytest.fixture
+def dm_mock(_dm_proto):
+    """Per-test DependencyManager stub.
+
+    copy.copy of the prototype is cheaper than rebuilding it, and a
+    SimpleNamespace copy gets its own __dict__, so per-test overrides
+    (paths, dep maps) never leak back into the prototype.
+    """
+    return copy.copy(_dm_proto)
+
+
+@pytest.fixture
+def builder_mock(_builder_proto):
+    """Per-test LayerBuilder stub; see dm_mock for the copy rationale."""
+    return copy.copy(_builder_proto)
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """One real temp directory per test module.
+
+    Function-scoped tmp_path creates a fresh directory for every test;
+    the packager tests only need a stable output directory, and each
+    build starts by purging its own .build subtree, so one directory per
+    module is enough.
+    """
+    return tmp_path_factory.mktemp("pkg")
+
+
+@pytest.fixture(scope="module")
+def paths(shared_tmp):
+    """Precomputed path strings shared across the module.
+
+    Tests kept rebuilding the same str(tmp / "...") chains; computing
+    the strings once avoids the repeated PurePath allocations and gives
+    every test the same names to assert against.
+    """
+    base = str(shared_tmp)
+    return _Paths(base, f"{base}/packages", f"{base}/layer", f"{base}/test-layer.zip")
+
+
+@pytest.fixture(scope="module")
+def py39_packager(shared_tmp):
+    """A default-config LambdaPackager shared across the module.
+
+    Construction (config normalization, runtime validation, output-dir
+    creation) runs once per module instead of per test. Tests stay
+    isolated because patched_packager re-points the instance's manager
+    and builder at the function-scoped mocks before every test.
+    """
+    # Placeholder stubs only; patched_packager swaps in the real test
+    # doubles before each test runs
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "layerpack.packager.DependencyManager",
+            lambda *a, **k: SimpleNamespace(),
+        )
+        mp.setattr("layerpack.packager.LayerBuilder", lambda *a, **k: SimpleNamespace())
+        from layerpack.packager import LambdaPackager
+
+        yield LambdaPackager("python3.9", str(shared_tmp))
+
+
+@pytest.fixture
+def patched_packager(monkeypatch, paths, py39_packager, dm_mock, builder_mock):
+    """Install the manager/builder mocks plus the shared build scaffolding.
+
+    Wires the instance mocks into layerpack.packager and returns
+    (dm_mock, builder_mock, zip_path) for tests that need to adjust or
+    inspect them. The mocks' path return values come from the
+    precomputed paths fixture — nothing ever reads them, so no
+    directories are created for them.
+    """
+    # The zip itself is never created — create_zip is mocked — so stub
+    # the existence check for it rather than touching a real file; every
+    # other path still goes to the real os.path.exists
+    real_exists = os.path.exists
+    monkeypatch.setattr(
+        "os.path.exists",
+        lambda p: os.fspath(p) == paths.zip or real_exists(p),
+    )
+
+    dm_mock.download_packages = lambda *a, **k: paths.packages
+    builder_mock.create_zip = lambda *a, **k: paths.zip
+    monkeypatch.setattr("layerpack.packager.DependencyManager", lambda *a, **k: dm_mock)
+    monkeypatch.setattr("layerpack.packager.LayerBuilder", lambda *a, **k: builder_mock)
+    py39_packager.dependency_manager = dm_mock
+    py39_packager.layer_builder = builder_mock
+    return dm_mock, builder_mock, paths.zip
@@ -1,14 +1,15 @@
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from click.testing import CliRunner
 
 from layerpack.cli import cli
 
 
-@patch("layerpack.cli.LambdaPackager")
+@patch("layerpack.packager.LambdaPackager")
 def test_create_layer_from_requirements(mock_packager, tmp_path):
     # Setup mock
-    mock_instance = Mock()
+    mock_instance = MagicMock()
+    mock_instance.__enter__.return_value = mock_instance
     mock_instance.create_layer_from_requirements.return_value = str(
         tmp_path / "test-layer.zip"
     )
@@ -35,10 +36,11 @@ def test_create_layer_from_requirements(mock_packager, tmp_path):
     assert "Created layer at:" in result.output
 
 
-@patch("layerpack.cli.LambdaPackager")
+@patch("layerpack.packager.LambdaPackager")
 def test_create_layer_from_packages(mock_packager, tmp_path):
     # Setup mock
-    mock_instance = Mock()
+    mock_instance = MagicMock()
+    mock_instance.__enter__.return_value = mock_instance
     mock_instance.create_layer_from_packages.return_value = str(
         tmp_path / "test-layer.zip"
     )
@@ -62,7 +64,7 @@ def test_create_layer_from_packages(mock_packager, tmp_path):
     assert "Created layer at:" in result.output
 
 
-@patch("layerpack.cli.DependencyManager")
+@patch("layerpack.packager.DependencyManager")
 def test_analyze_requirements(mock_dm, tmp_path):
     # Setup mock
     mock_instance = Mock()
@@ -1,12 +1,15 @@
+import json
 import os
 from unittest.mock import Mock, patch
 
-from layerpack.dependency_manager import DependencyManager
+from layerpack.dependency_manager import DependencyManager, _probe_uv
 
 
 @patch("subprocess.run")
-def test_resolve_dependencies_uv_success(mock_run):
+def test_resolve_dependencies_uv_success(mock_run, monkeypatch, tmp_path):
     """Test successful dependency resolution using uv."""
+    _probe_uv.cache_clear()
+    monkeypatch.setenv("LAYERPACK_CACHE", str(tmp_path / "cache"))
     # Mock subprocess run to return a successful result with package versions
     mock_version_check = Mock()
     mock_version_check.stdout = ""
@@ -45,17 +48,81 @@ def test_resolve_dependencies_uv_success(mock_run):
 
 
 @patch("subprocess.run")
-def test_download_packages(mock_run, tmp_path):
+def test_resolve_dependencies_pip_fallback(mock_run, monkeypatch, tmp_path):
+    """Test resolution via pip's dry-run report when uv is unavailable."""
+    _probe_uv.cache_clear()
+    monkeypatch.setenv("LAYERPACK_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("PATH", "")
+
+    def fake_pip(cmd, **kwargs):
+        report_path = cmd[cmd.index("--report") + 1]
+        with open(report_path, "w") as f:
+            json.dump(
+                {
+                    "install": [
+                        {"metadata": {"name": "requests", "version": "2.28.1"}},
+                        {"metadata": {"name": "urllib3", "version": "1.26.8"}},
+                    ]
+                },
+                f,
+            )
+        return Mock(stdout="", stderr="")
+
+    mock_run.side_effect = fake_pip
+
+    dm = DependencyManager()
+    assert not dm.use_uv
+
+    deps = dm.resolve_dependencies(["requests"])
+    assert deps == {"requests": "2.28.1", "urllib3": "1.26.8"}
+
+    cmd = mock_run.call_args[0][0]
+    assert cmd[:3] == ["pip", "install", "--dry-run"]
+
+
+@patch("subprocess.run")
+def test_resolve_dependencies_cached(mock_run, monkeypatch, tmp_path):
+    """Test that a warm cache skips the resolver subprocess."""
+    _probe_uv.cache_clear()
+    monkeypatch.setenv("LAYERPACK_CACHE", str(tmp_path / "cache"))
+
+    mock_version_check = Mock()
+    mock_version_check.stdout = ""
+
+    mock_compile = Mock()
+    mock_compile.stdout = "requests==2.28.1"
+
+    mock_run.side_effect = [mock_version_check, mock_compile]
+
+    dm = DependencyManager(uv_path="/mock/uv")
+    deps = dm.resolve_dependencies(["requests"])
+    assert deps == {"requests": "2.28.1"}
+
+    # A second manager resolving the same specs should hit the disk cache
+    # (and the memoized uv probe skips its version check, too)
+    dm2 = DependencyManager(uv_path="/mock/uv")
+    deps2 = dm2.resolve_dependencies(["requests"])
+    assert deps2 == deps
+
+    # One version check plus a single compile call
+    assert mock_run.call_count == 2
+
+
+@patch("subprocess.Popen")
+@patch("subprocess.run")
+def test_download_packages(mock_run, mock_popen, tmp_path):
     """Test downloading packages."""
+    _probe_uv.cache_clear()
+
     # Mock version check and package download responses
     mock_version_check = Mock()
     mock_version_check.stdout = ""
+    mock_run.return_value = mock_version_check
 
-    mock_install = Mock()
-    mock_install.returncode = 0
-    mock_install.stderr = ""
-
-    mock_run.side_effect = [mock_version_check, mock_install]
+    mock_proc = Mock()
+    mock_proc.communicate.return_value = (None, "")
+    mock_proc.returncode = 0
+    mock_popen.return_value = mock_proc
 
     dm = DependencyManager(uv_path="/mock/uv")
     dm.temp_dir = str(tmp_path)  # Override temp dir for testing
@@ -67,15 +134,19 @@ def test_download_packages(mock_run, tmp_path):
     assert os.path.basename(download_path) == "packages"
     assert os.path.exists(download_path)
 
-    # Verify both calls were made with correct arguments
-    assert mock_run.call_count == 2
-    calls = mock_run.call_args_list
-
-    # First call should be version check
-    assert calls[0][0][0] == ["/mock/uv", "--version"]
-
-    # Second call should be package installation
-    assert "/mock/uv" in calls[1][0][0]
-    assert "pip" in calls[1][0][0]
-    assert "install" in calls[1][0][0]
-    assert "requests==2.28.1" in calls[1][0][0]
+    # The only subprocess.run call should be the version check
+    assert mock_run.call_count == 1
+    assert mock_run.call_args[0][0] == ["/mock/uv", "--version"]
+
+    # The install should be a single batched Popen invocation
+    install_cmd = mock_popen.call_args[0][0]
+    assert "/mock/uv" in install_cmd
+    assert "pip" in install_cmd
+    assert "install" in install_cmd
+    assert "--no-deps" in install_cmd
+    assert "-r" in install_cmd
+
+    # The lock file should contain the pinned spec
+    lock_path = install_cmd[install_cmd.index("-r") + 1]
+    with open(lock_path) as f:
+        assert "requests==2.28.1" in f.read()
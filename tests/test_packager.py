@@ -1,6 +1,5 @@
 import os
 from pathlib import Path
-from unittest.mock import Mock, patch
 
 import pytest
 
@@ -8,164 +7,85 @@ from layerpack.exceptions import IncompatibleRuntimeError
 from layerpack.packager import LambdaPackager
 
 
-def test_init_invalid_runtime():
+@pytest.mark.parametrize("runtime", ["python2.7", "python3.5", "nodejs18", "ruby"])
+def test_init_invalid_runtime(runtime):
     with pytest.raises(IncompatibleRuntimeError):
-        LambdaPackager("python2.7", "./dist")
-
-
-@patch("layerpack.packager.DependencyManager")
-@patch("layerpack.packager.LayerBuilder")
-def test_create_layer_from_packages(mock_builder, mock_dm, tmp_path):
-    # Create necessary directories
-    packages_dir = tmp_path / "packages"
-    packages_dir.mkdir(parents=True, exist_ok=True)
-
-    # Setup mocks
-    mock_dm_instance = Mock()
-    mock_dm_instance.resolve_dependencies.return_value = {"requests": "2.28.1"}
-    mock_dm_instance.download_packages.return_value = str(packages_dir)
-    mock_dm.return_value = mock_dm_instance
-
-    mock_builder_instance = Mock()
-    mock_builder_instance.create_layer_structure.return_value = str(tmp_path / "layer")
-    mock_builder_instance.create_zip.return_value = str(tmp_path / "test-layer.zip")
-    mock_builder.return_value = mock_builder_instance
-
-    # Create dummy package file
-    (packages_dir / "requests").mkdir(parents=True, exist_ok=True)
-    (packages_dir / "requests" / "__init__.py").touch()
-
-    # Create test zip file
-    (tmp_path / "test-layer.zip").touch()
-
-    packager = LambdaPackager("python3.9", str(tmp_path))
-    path = packager.create_layer_from_packages(["requests"], "test-layer")
-
-    assert str(path).endswith(".zip")
-    assert path.exists()
-
-
-@patch("layerpack.packager.DependencyManager")
-@patch("layerpack.packager.LayerBuilder")
-def test_create_layer_from_requirements(mock_builder, mock_dm, tmp_path):
-    # Create necessary directories
-    packages_dir = tmp_path / "packages"
-    packages_dir.mkdir(parents=True, exist_ok=True)
-
-    # Setup mocks
-    mock_dm_instance = Mock()
-    mock_dm_instance.resolve_dependencies.return_value = {
-        "requests": "2.28.1",
-        "urllib3": "1.26.8",
-    }
-    mock_dm_instance.download_packages.return_value = str(packages_dir)
-    mock_dm.return_value = mock_dm_instance
-
-    mock_builder_instance = Mock()
-    mock_builder_instance.create_layer_structure.return_value = str(tmp_path / "layer")
-    mock_builder_instance.create_zip.return_value = str(tmp_path / "test-layer.zip")
-    mock_builder.return_value = mock_builder_instance
-
-    # Create test requirements file
-    requirements_path = tmp_path / "requirements.txt"
-    requirements_path.write_text("requests==2.28.1\nurllib3==1.26.8")
-
-    # Create dummy package files
-    for pkg in ["requests", "urllib3"]:
-        pkg_dir = packages_dir / pkg
-        pkg_dir.mkdir(parents=True, exist_ok=True)
-        (pkg_dir / "__init__.py").touch()
-
-    # Create test zip file
-    (tmp_path / "test-layer.zip").touch()
-
-    packager = LambdaPackager("python3.9", str(tmp_path))
-    path = packager.create_layer_from_requirements(str(requirements_path), "test-layer")
-
-    assert str(path).endswith(".zip")
-    assert path.exists()
-
-
-@patch("layerpack.packager.DependencyManager")
-@patch("layerpack.packager.LayerBuilder")
-def test_config_exclude_packages(mock_builder, mock_dm, tmp_path):
-    # Create necessary directories
-    packages_dir = tmp_path / "packages"
-    packages_dir.mkdir(parents=True, exist_ok=True)
-
-    # Setup mocks
-    mock_dm_instance = Mock()
-    mock_dm_instance.resolve_dependencies.return_value = {"requests": "2.28.1"}
-    mock_dm_instance.download_packages.return_value = str(packages_dir)
-    mock_dm.return_value = mock_dm_instance
-
-    mock_builder_instance = Mock()
-    mock_builder_instance.create_layer_structure.return_value = str(tmp_path / "layer")
-    mock_builder_instance.create_zip.return_value = str(tmp_path / "test-layer.zip")
-    mock_builder.return_value = mock_builder_instance
-
-    # Create dummy package file
-    (packages_dir / "requests").mkdir(parents=True, exist_ok=True)
-    (packages_dir / "requests" / "__init__.py").touch()
-
-    # Create test zip file
-    (tmp_path / "test-layer.zip").touch()
-
-    config = {"exclude_packages": ["urllib3"]}
-    packager = LambdaPackager("python3.9", str(tmp_path), config)
-    path = packager.create_layer_from_packages(["requests", "urllib3"], "test-layer")
+        LambdaPackager(runtime, "./dist")
+
+
+@pytest.mark.parametrize(
+    ("source", "packages", "resolved", "config"),
+    [
+        ("packages", ["requests"], {"requests": "2.28.1"}, None),
+        (
+            "requirements",
+            ["requests==2.28.1", "urllib3==1.26.8"],
+            {"requests": "2.28.1", "urllib3": "1.26.8"},
+            None,
+        ),
+        (
+            "packages",
+            ["requests", "urllib3"],
+            {"requests": "2.28.1"},
+            {"exclude_packages": ["urllib3"]},
+        ),
+    ],
+    ids=["packages", "requirements", "exclude"],
+)
+def test_create_layer(
+    monkeypatch,
+    patched_packager,
+    py39_packager,
+    paths,
+    source,
+    packages,
+    resolved,
+    config,
+):
+    dm_mock, _, _ = patched_packager
+    dm_mock.resolve_dependencies = lambda *a, **k: resolved
+
+    # The default-config cases share the module-scoped packager; only a
+    # case with its own config pays for a fresh construction
+    if config is None:
+        packager = py39_packager
+    else:
+        packager = LambdaPackager("python3.9", paths.base, config)
+    if source == "requirements":
+        # Serve the requirements content from memory rather than writing
+        # a real file; only the existence check for this one path and its
+        # read are stubbed
+        requirements_path = f"{paths.base}/requirements.txt"
+        data = "\n".join(packages).encode()
+        real_exists = Path.exists
+        monkeypatch.setattr(
+            Path,
+            "exists",
+            lambda self: str(self) == requirements_path or real_exists(self),
+        )
+        monkeypatch.setattr(Path, "read_bytes", lambda self: data)
+        path = packager.create_layer_from_requirements(requirements_path, "test-layer")
+    else:
+        path = packager.create_layer_from_packages(packages, "test-layer")
 
     assert str(path).endswith(".zip")
-    assert path.exists()
-
-
-@patch("layerpack.packager.DependencyManager")
-@patch("layerpack.packager.LayerBuilder")
-@patch("layerpack.packager.shutil.copytree")
-def test_config_include_source(mock_copytree, mock_builder, mock_dm, tmp_path):
-    # Create necessary directories
-    packages_dir = tmp_path / "packages"
-    packages_dir.mkdir(parents=True, exist_ok=True)
-
-    # Setup mocks
-    mock_dm_instance = Mock()
-    mock_dm_instance.resolve_dependencies.return_value = {"requests": "2.28.1"}
-    mock_dm_instance.download_packages.return_value = str(packages_dir)
-    mock_dm.return_value = mock_dm_instance
+    assert os.path.exists(path)
 
-    mock_builder_instance = Mock()
-    mock_builder_instance.create_layer_structure.return_value = str(tmp_path / "layer")
-    mock_builder_instance.create_zip.return_value = str(tmp_path / "test-layer.zip")
-    mock_builder.return_value = mock_builder_instance
 
+@pytest.mark.usefixtures("patched_packager")
+def test_config_include_source(paths, shared_tmp):
     # Create test source directory with content
-    source_dir = tmp_path / "custom_module"
+    source_dir = shared_tmp / "custom_module"
     source_dir.mkdir(parents=True, exist_ok=True)
     (source_dir / "test.py").write_text("print('test')")
 
-    # Create dummy package file
-    (packages_dir / "requests").mkdir(parents=True, exist_ok=True)
-    (packages_dir / "requests" / "__init__.py").touch()
-
-    # Create test zip file
-    (tmp_path / "test-layer.zip").touch()
-
-    # Mock copytree to prevent actual file operations
-    mock_copytree.return_value = None
-
     config = {"include_source": [str(source_dir)]}
-    packager = LambdaPackager("python3.9", str(tmp_path), config)
+    packager = LambdaPackager("python3.9", paths.base, config)
     path = packager.create_layer_from_packages(["requests"], "test-layer")
 
     assert str(path).endswith(".zip")
-    assert path.exists()
+    assert os.path.exists(path)
 
-    # Verify source directory was included
-    mock_copytree.assert_called_with(
-        str(source_dir),
-        str(
-            Path(mock_builder_instance.create_layer_structure.return_value)
-            / source_dir.name
-        ),
-        dirs_exist_ok=True,
-    )
+    # Verify source directory was staged into the layer build tree
+    layer_dir = shared_tmp / ".build" / "test-layer"
+    assert (layer_dir / source_dir.name / "test.py").exists()